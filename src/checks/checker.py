@@ -2,6 +2,8 @@
 
 from abc import ABC, abstractmethod
 
+from . import file_cache as fc
+
 
 class Checker(ABC):
     """Astract base class for checkers.
@@ -9,10 +11,12 @@ class Checker(ABC):
     Arguments:
         check_interval_seconds: The number of seconds between each call to `check`.
             Note that the check method must not sleep, the delay between intervals is handled outside of checkers.
+        file_cache: Cache for /proc and sysfs files read on every check. Defaults to the cache shared by all checkers.
     """
 
-    def __init__(self, check_interval_seconds: int):
+    def __init__(self, check_interval_seconds: int, file_cache: fc.FileCache | None = None):
         self.check_interval_seconds = check_interval_seconds
+        self.file_cache = file_cache if file_cache is not None else fc.shared
 
     @property
     @abstractmethod
@@ -0,0 +1,143 @@
+"""Persistent file handle cache for /proc and sysfs pseudo-files read on every check.
+
+Files are opened once and kept open across checks. Each read re-generates the file content with `os.preadv` from offset 0
+into a reusable per-file buffer, saving the open/close syscalls and the allocations of a new file object per read.
+
+Handles are evicted when the file (or the process owning it) disappears, and the number of open handles is capped.
+"""
+
+import os
+import errno
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+import logging
+
+
+_LOG = logging.getLogger(__name__)
+
+# Errors meaning that the file, directory or process has gone away.
+_GONE_ERRNOS = frozenset((errno.ENOENT, errno.ESRCH, errno.ENODEV, errno.ENXIO, errno.ESTALE))
+
+
+@dataclass(slots=True)
+class _Handle():
+    """An open file descriptor and its read buffer."""
+
+    fd: int
+    buf: bytearray
+
+
+class FileCache():
+    """Keep pseudo-files open between checks and re-read them into reusable buffers.
+
+    Arguments:
+        max_open: Maximum number of file descriptors kept open. The least recently read file is closed when exceeded.
+        buf_size: Initial size of the read buffer of each file. Buffers grow as needed.
+    """
+
+    def __init__(self, max_open: int = 256, buf_size: int = 4096):
+        if max_open < 1:
+            raise ValueError(f"max_open must be at least 1, got {max_open}")
+        if buf_size < 1:
+            raise ValueError(f"buf_size must be at least 1, got {buf_size}")
+
+        self.max_open = max_open
+        self.buf_size = buf_size
+        self._handles: OrderedDict[str, _Handle] = OrderedDict()
+
+    def __len__(self):
+        return len(self._handles)
+
+    def __contains__(self, path) -> bool:
+        return str(path) in self._handles
+
+    def read(self, path: Path | str) -> memoryview | None:
+        """Return the current content of `path`, or None if the file or the process owning it no longer exists.
+
+        The returned memoryview refers to the buffer of `path`, it is only valid until the next read of the same path.
+        Other OSErrors, e.g. PermissionError, are raised.
+        """
+
+        key = str(path)
+        handle = self._handles.get(key)
+        if handle is not None:
+            try:
+                self._handles.move_to_end(key)
+                return self._pread(handle)
+            except OSError as ex:
+                _LOG.debug("Evicting '%s': %s", key, ex)
+                self.evict(key)
+                if ex.errno not in _GONE_ERRNOS:
+                    raise
+                # The fd may refer to a file which has been replaced, e.g. a reused PID or re-created directory.
+
+        try:
+            fd = os.open(key, os.O_RDONLY | os.O_CLOEXEC)
+        except OSError as ex:
+            if ex.errno in _GONE_ERRNOS:
+                return None
+            raise
+
+        handle = _Handle(fd, bytearray(self.buf_size))
+        self._handles[key] = handle
+        while len(self._handles) > self.max_open:
+            _, oldest = self._handles.popitem(last=False)
+            os.close(oldest.fd)
+
+        try:
+            return self._pread(handle)
+        except OSError as ex:
+            self.evict(key)
+            if ex.errno in _GONE_ERRNOS:
+                return None
+            raise
+
+    def read_text(self, path: Path | str) -> str | None:
+        """Return the current content of `path` decoded as utf-8, or None if it no longer exists."""
+        data = self.read(path)
+        return None if data is None else str(data, "utf-8", "replace")
+
+    def evict(self, path: Path | str):
+        """Close and forget `path` if it is open."""
+        handle = self._handles.pop(str(path), None)
+        if handle is not None:
+            os.close(handle.fd)
+
+    def evict_under(self, directory: Path | str, keep: set[str]):
+        """Close all files below `directory` which are not in `keep`.
+
+        Used by checkers to release handles of e.g. processes or clients which were not seen in the latest check.
+        """
+
+        prefix = str(directory).rstrip("/") + "/"
+        for key in [key for key in self._handles if key.startswith(prefix) and key not in keep]:
+            self.evict(key)
+
+    def close(self):
+        """Close all files."""
+        while self._handles:
+            _, handle = self._handles.popitem()
+            os.close(handle.fd)
+
+    @staticmethod
+    def _pread(handle: _Handle) -> memoryview:
+        """Read the whole file, growing the buffer until the content fits.
+
+        Pseudo-files generate their content on read, and seq_file based files return about one page per read whatever
+        the buffer size, so reading continues at increasing offsets until end of file.
+        """
+        size = 0
+        while True:
+            if size == len(handle.buf):
+                # Replace rather than resize, a memoryview returned by a previous read may still be referenced.
+                buf = bytearray(2 * len(handle.buf))
+                buf[:size] = handle.buf
+                handle.buf = buf
+            num = os.preadv(handle.fd, [memoryview(handle.buf)[size:]], size)
+            if not num:
+                return memoryview(handle.buf)[:size]
+            size += num
+
+
+shared = FileCache()
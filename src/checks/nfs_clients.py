@@ -5,6 +5,7 @@ from pathlib import Path
 import logging
 
 from . import checker
+from .file_cache import FileCache
 
 
 _LOG = logging.getLogger(__name__)
@@ -12,8 +13,10 @@ _LOG = logging.getLogger(__name__)
 
 class Checker(checker.Checker):
     """Check for NFS clients."""
-    def __init__(self, check_interval_seconds: int, clients_dir: Path = Path("/proc/fs/nfsd/clients")):
-        super().__init__(check_interval_seconds=check_interval_seconds)
+    def __init__(
+            self, check_interval_seconds: int, clients_dir: Path = Path("/proc/fs/nfsd/clients"),
+            file_cache: FileCache | None = None):
+        super().__init__(check_interval_seconds=check_interval_seconds, file_cache=file_cache)
         self.clients_dir = clients_dir
         self.clients: set[tuple[str, str]] = set()
         self.client_dir_found = True  # Assumed
@@ -33,17 +36,25 @@ class Checker(checker.Checker):
                 logging.INFO if self.client_dir_found else logging.DEBUG,
                 "%s: No clients - directory '%s' does not exist. ", self.name, self.clients_dir)
             self.client_dir_found = False
+            self.file_cache.evict_under(self.clients_dir, set())
             return ""
 
         self.client_dir_found = True
 
         active_clients: list[tuple[str, str]] = []
+        info_files: set[str] = set()
         for client_dir in os.scandir(self.clients_dir):
+            info_file = os.path.join(client_dir.path, "info")
+            info = self.file_cache.read_text(info_file)
+            if info is None:
+                # Client disconnected after scandir.
+                continue
+
+            info_files.add(info_file)
             client_info = []
-            with open(Path(client_dir)/"info", encoding="utf-8") as inf:
-                for line in inf.readlines():
-                    if line.startswith("name:") or line.startswith("address:"):
-                        client_info.append(line.strip())
+            for line in info.splitlines():
+                if line.startswith("name:") or line.startswith("address:"):
+                    client_info.append(line.strip())
 
             key = (client_dir.name, ", ".join([line.split(":")[1].strip().strip('"') for line in client_info]))
             active_clients.append(key)
@@ -52,6 +63,8 @@ class Checker(checker.Checker):
                 "%s: Found client %s - prevent sleep", self.name, client_info or client_dir)
             continue
 
+        self.file_cache.evict_under(self.clients_dir, info_files)
+
         for client in self.clients:
             if client not in active_clients:
                 _LOG.info("%s: Client %s has disconnected.", self.name, client)
@@ -8,6 +8,7 @@ import logging
 import psutil
 
 from . import checker
+from .file_cache import FileCache
 
 
 _LOG = logging.getLogger(__name__)
@@ -15,15 +16,85 @@ _LOG = logging.getLogger(__name__)
 
 class Checker(checker.Checker):
     """Check for *active* SSH clients."""
-    def __init__(self, check_interval_seconds: int, max_read_chars_per_second: int = 20):
-        super().__init__(check_interval_seconds=check_interval_seconds)
+    def __init__(self, check_interval_seconds: int, max_read_chars_per_second: int = 20, file_cache: FileCache | None = None):
+        super().__init__(check_interval_seconds=check_interval_seconds, file_cache=file_cache)
         self.max_read_chars = max_read_chars_per_second * check_interval_seconds
         self.clients: dict[int, tuple[int, bool, str]] = {}  # pid -> read_chars, active, username
+        self.io_files: set[str] = set()  # /proc/<pid>/io files held open in file_cache
 
     @property
     def name(self):
         return "SSH"
 
+    def _read_chars(self, pid: int) -> int | None:
+        """Return 'rchar' from /proc/<pid>/io, None if the process is gone."""
+        io = self.file_cache.read(f"/proc/{pid}/io")
+        if io is None:
+            return None
+
+        for line in bytes(io).splitlines():
+            if line.startswith(b"rchar:"):
+                return int(line[6:])
+        return 0
+
+    def _check_session(self, proc: psutil.Process, prev_clients: dict[int, tuple[int, bool, str]], io_files: set[str]) -> tuple[int, str] | None:
+        """Register `proc` in `self.clients` if it is a user ssh session.
+
+        Return:
+            (pid, username) if `proc` is a user ssh session which should prevent sleep, otherwise None.
+        """
+
+        info = proc.info  # type: ignore
+        if info["name"] not in ("sshd-session", "sshd"):
+            return None
+
+        try:
+            username = proc.username()
+        except psutil.Error:
+            return None
+
+        if username in ("root", "sshd"):
+            return None
+
+        _LOG.debug("%s: %s", self.name, info)
+        pid = info["pid"]
+        prev_read_chars, prev_active, _ = prev_clients.get(pid, (0, False, ""))
+
+        try:
+            read_chars = self._read_chars(pid)
+            if read_chars is None:
+                # Process exited after process_iter.
+                return None
+            io_files.add(f"/proc/{pid}/io")
+            read_since_last = read_chars - prev_read_chars
+            active = read_since_last > self.max_read_chars
+        except PermissionError as ex:
+            _LOG.warning("%s: Must run as root to determine if session is active. Assuming all sessions active. %s.", self.name, ex)
+            read_chars = 0
+            active = True
+
+        self.clients[pid] = read_chars, active, username
+
+        if active:
+            level = logging.INFO if not prev_active else logging.DEBUG
+            if read_chars:
+                _LOG.log(
+                    level, "%s: Active connection %s, user %s, read %s (more than %s) characters since last check - prevent sleep.",
+                    self.name, pid, username, read_since_last, self.max_read_chars)
+            else:
+                _LOG.log(level, "%s: connection %s assumed active, user %s - prevent sleep.", self.name, pid, username)
+            return pid, username
+
+        if pid not in prev_clients :
+            _LOG.info("%s: Found connection %s, user '%s' - prevent sleep", self.name, pid, username)
+            return pid, username
+
+        _LOG.log(
+            logging.INFO if prev_active else logging.DEBUG,
+            "%s: Inactive connection %s, user %s read %s (less than %s) characters since last check.",
+            self.name, pid, username, read_since_last, self.max_read_chars)
+        return None
+
     def check(self) -> str:
         """Return non-empty str with info if any active ssh connections are found.
 
@@ -31,54 +102,21 @@ class Checker(checker.Checker):
         """
 
         prev_clients = self.clients
-        prev_active_clients = False
         self.clients = {}
         active_clients = []
 
-        for proc in psutil.process_iter(["pid", "name", "username", "io_counters"]):
-            # info = proc.as_dict()
-            info = proc.info  # type: ignore
-            username = info["username"]
-
-            if info["name"] in ("sshd-session", "sshd") and username not in ("root", "sshd"):
-                _LOG.debug("%s: %s", self.name, info)
-                pid = info["pid"]
-
-                prev_read_chars, prev_active, _ = prev_clients.get(pid, (0, False, ""))
-                prev_active_clients = prev_active_clients or prev_active
-
-                try:
-                    read_chars = info["io_counters"].read_chars
-                    read_since_last = read_chars - prev_read_chars
-                    active = read_since_last > self.max_read_chars
-                except AttributeError as ex:
-                    _LOG.warning("%s: Must run as root to determine if session is active. Assuming all sessions active. %s.", self.name, ex)
-                    read_chars = 0
-                    active = True
-
-                self.clients[pid] = read_chars, active, username
-
-                if active:
-                    level = logging.INFO if not prev_active else logging.DEBUG
-                    if read_chars:
-                        _LOG.log(
-                            level, "%s: Active connection %s, user %s, read %s (more than %s) characters since last check - prevent sleep.",
-                            self.name, pid, username, read_since_last, self.max_read_chars)
-                    else:
-                        _LOG.log(level, "%s: connection %s assumed active, user %s - prevent sleep.", self.name, pid, username)
-
-                    active_clients.append((pid, username))
-                    continue
-
-                if pid not in prev_clients :
-                    _LOG.info("%s: Found connection %s, user '%s' - prevent sleep", self.name, pid, username)
-                    active_clients.append((pid, username))
-                    continue
+        # Only the name is fetched for all processes, /proc/<pid>/io is read through the file cache for ssh sessions only.
+        io_files: set[str] = set()
+        for proc in psutil.process_iter(["pid", "name"]):
+            client = self._check_session(proc, prev_clients, io_files)
+            if client:
+                active_clients.append(client)
 
-                _LOG.log(
-                    logging.INFO if prev_active else logging.DEBUG,
-                    "%s: Inactive connection %s, user %s read %s (less than %s) characters since last check.",
-                    self.name, pid, username, read_since_last, self.max_read_chars)
+        prev_active_clients = any(prev_clients[pid][1] for pid in self.clients if pid in prev_clients)
+
+        for io_file in self.io_files - io_files:
+            self.file_cache.evict(io_file)
+        self.io_files = io_files
 
         for pid in prev_clients:
             if pid not in self.clients:
@@ -65,7 +65,7 @@ def prevent_sleep(loglevel, check_interval_seconds = 10, max_inactive_seconds =
     check_inhibitors = []
     _LOG.info("")
     for ff in os.scandir(_HERE/"checks"):
-        if not ff.name.endswith(".py") or ff.name in ["__init__.py", "checker.py"]:
+        if not ff.name.endswith(".py") or ff.name in ["__init__.py", "checker.py", "file_cache.py"]:
             continue
         mod = importlib.import_module(".checks." + Path(ff).stem, package="prevent_sleep")
         checker = mod.Checker(check_interval_seconds)
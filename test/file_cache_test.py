@@ -0,0 +1,117 @@
+import os
+
+import pytest
+
+from prevent_sleep.checks.file_cache import FileCache
+
+
+def test_file_cache_read(out_dir):
+    ff = out_dir/"info"
+    ff.write_text("name: a\n")
+    cache = FileCache()
+
+    assert cache.read_text(ff) == "name: a\n"
+    assert ff in cache
+
+    # Re-read through the same fd.
+    ff.write_text("name: bb\n")
+    assert cache.read_text(ff) == "name: bb\n"
+    assert len(cache) == 1
+    cache.close()
+    assert not cache
+
+
+def test_file_cache_buffer_grows(out_dir):
+    ff = out_dir/"big"
+    content = "x" * 10000
+    ff.write_text(content)
+    cache = FileCache(buf_size=16)
+
+    first = cache.read(ff)
+    assert bytes(first) == content.encode()
+    # Previous view is still usable while the buffer is replaced.
+    ff.write_text(content * 2)
+    assert bytes(cache.read(ff)) == (content * 2).encode()
+    assert bytes(first) == content.encode()
+    cache.close()
+
+
+def test_file_cache_missing(out_dir):
+    cache = FileCache()
+    assert cache.read(out_dir/"nonexisting") is None
+    assert not cache
+
+
+def test_file_cache_max_open(out_dir):
+    cache = FileCache(max_open=2)
+    for ii in range(3):
+        (out_dir/str(ii)).write_text(str(ii))
+        assert cache.read_text(out_dir/str(ii)) == str(ii)
+
+    assert len(cache) == 2
+    assert out_dir/"0" not in cache
+    cache.close()
+
+
+@pytest.mark.parametrize("kwargs", [{"max_open": 0}, {"buf_size": 0}])
+def test_file_cache_invalid_args(kwargs):
+    with pytest.raises(ValueError):
+        FileCache(**kwargs)
+
+
+def test_file_cache_evict_under(out_dir):
+    clients = out_dir/"clients"
+    for name in ("a", "b"):
+        (clients/name).mkdir(parents=True)
+        (clients/name/"info").write_text(name)
+
+    other = out_dir/"other"
+    other.write_text("other")
+
+    cache = FileCache()
+    for ff in (clients/"a/info", clients/"b/info", other):
+        assert cache.read(ff) is not None
+
+    cache.evict_under(clients, {str(clients/"a/info")})
+    assert clients/"a/info" in cache
+    assert clients/"b/info" not in cache
+    assert other in cache
+    cache.close()
+
+
+def test_file_cache_process_gone():
+    """An fd of /proc/<pid>/... of an exited process gives ESRCH and is evicted."""
+    pid = os.fork()
+    if not pid:
+        os._exit(0)  # pylint: disable=protected-access
+
+    cache = FileCache()
+    try:
+        # The zombie is readable until reaped.
+        assert cache.read(f"/proc/{pid}/status") is not None
+        os.waitpid(pid, 0)
+        assert cache.read(f"/proc/{pid}/status") is None
+        assert f"/proc/{pid}/status" not in cache
+    finally:
+        cache.close()
+
+
+def test_file_cache_proc_self():
+    cache = FileCache()
+    assert "rchar:" in cache.read_text("/proc/self/io")
+    assert "rchar:" in cache.read_text("/proc/self/io")
+    cache.close()
+
+
+def test_file_cache_seq_file_larger_than_page():
+    """seq_file pseudo-files return about one page per read."""
+    cache = FileCache(buf_size=64)
+    maps = cache.read_text("/proc/self/maps")
+    with open("/proc/self/maps", encoding="utf-8") as inf:
+        expected = inf.read()
+
+    assert len(expected) > 4096
+    # Mappings may change slightly between reads, compare the stable start and the size.
+    assert maps.splitlines()[:10] == expected.splitlines()[:10]
+    assert abs(len(maps) - len(expected)) < 1024
+    cache.close()
@@ -0,0 +1,33 @@
+import shutil
+
+from prevent_sleep.checks import nfs_clients
+from prevent_sleep.checks.file_cache import FileCache
+
+
+def test_nfs_clients(out_dir):
+    for client_id in ("1", "2"):
+        (out_dir/client_id).mkdir()
+        (out_dir/client_id/"info").write_text(f'clientid: {client_id}\naddress: "10.0.0.{client_id}"\nname: "client{client_id}"\n')
+
+    cache = FileCache()
+    checker = nfs_clients.Checker(1, clients_dir=out_dir, file_cache=cache)
+
+    assert not checker.clients
+    assert checker.check().startswith("2 clients")
+    assert checker.clients == {("1", "10.0.0.1, client1"), ("2", "10.0.0.2, client2")}
+    assert len(cache) == 2
+
+    shutil.rmtree(out_dir/"2")
+    assert checker.check() == "1 clients [('1', '10.0.0.1, client1')]"
+    assert out_dir/"1"/"info" in cache
+    assert out_dir/"2"/"info" not in cache
+
+    shutil.rmtree(out_dir/"1")
+    assert checker.check() == ""
+    assert not cache
+
+
+def test_nfs_clients_no_dir(out_dir):
+    checker = nfs_clients.Checker(1, clients_dir=out_dir/"nonexisting", file_cache=FileCache())
+    assert checker.check() == ""
+    assert not checker.client_dir_found
@@ -0,0 +1,72 @@
+"""Compare re-opening pseudo-files on every check with reading them through FileCache.
+
+Run with: python test/perf/file_cache_bench.py [num_processes] [ticks]
+
+Reads /proc/<pid>/status and /proc/<pid>/io for `num_processes` (default 500) child processes, and the 'info' file of the
+same number of fake NFS client directories, `ticks` (default 50) times.
+"""
+
+import os
+import sys
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from prevent_sleep.checks.file_cache import FileCache
+
+
+def _open_read(paths, ticks):
+    for _ in range(ticks):
+        for path in paths:
+            try:
+                with open(path, encoding="utf-8") as inf:
+                    inf.read()
+            except PermissionError:
+                pass
+
+
+def _cache_read(paths, ticks):
+    cache = FileCache(max_open=len(paths))
+    for _ in range(ticks):
+        for path in paths:
+            try:
+                cache.read_text(path)
+            except PermissionError:
+                pass
+    cache.close()
+
+
+def _bench(title, paths, ticks):
+    results = []
+    for func in (_open_read, _cache_read):
+        start = time.perf_counter()
+        func(paths, ticks)
+        results.append(time.perf_counter() - start)
+        print(f"{title:>6} {func.__name__:>11}: {results[-1] / ticks * 1000:8.3f} ms/tick")
+    print(f"{title:>6} speedup: {results[0] / results[1]:.2f}x\n")
+
+
+def main(num_processes=500, ticks=50):
+    """Run benchmark."""
+    procs = [subprocess.Popen(["sleep", "600"]) for _ in range(num_processes)]  # pylint: disable=consider-using-with
+    try:
+        paths = [f"/proc/{proc.pid}/{name}" for proc in procs for name in ("status", "io")]
+        _bench("proc", paths, ticks)
+    finally:
+        for proc in procs:
+            proc.kill()
+            proc.wait()
+
+    with tempfile.TemporaryDirectory() as clients_dir:
+        paths = []
+        for ii in range(num_processes):
+            client_dir = Path(clients_dir)/str(ii)
+            client_dir.mkdir()
+            (client_dir/"info").write_text(f'clientid: {ii}\naddress: "10.0.0.1:{ii}"\nname: "client{ii}"\n')
+            paths.append(os.path.join(client_dir, "info"))
+        _bench("nfs", paths, ticks)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
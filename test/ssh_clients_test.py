@@ -0,0 +1,69 @@
+import logging
+import os
+import signal
+import time
+
+import psutil
+
+from prevent_sleep.checks import ssh_clients
+from prevent_sleep.checks.file_cache import FileCache
+
+
+def test_ssh_clients_read_chars():
+    cache = FileCache()
+    checker = ssh_clients.Checker(1, file_cache=cache)
+
+    read_chars = checker._read_chars(os.getpid())  # pylint: disable=protected-access
+    assert read_chars > 0
+    assert f"/proc/{os.getpid()}/io" in cache
+    cache.close()
+
+
+def test_ssh_clients_session_gone(monkeypatch):
+    pid = os.fork()
+    if not pid:
+        time.sleep(60)
+        os._exit(0)  # pylint: disable=protected-access
+
+    proc = psutil.Process(pid)
+    proc.info = {"pid": pid, "name": "sshd-session"}
+    procs = [proc]
+    monkeypatch.setattr(ssh_clients.psutil, "process_iter", lambda attrs: list(procs))
+    monkeypatch.setattr(psutil.Process, "username", lambda self: "john")
+
+    cache = FileCache()
+    checker = ssh_clients.Checker(1, file_cache=cache)
+    try:
+        assert checker.check() == f"1 active clients [({pid}, 'john')]"
+        assert checker.io_files == {f"/proc/{pid}/io"}
+        assert f"/proc/{pid}/io" in cache
+    finally:
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+
+    # Still listed, as if the process exited after process_iter, its cached io file gives ESRCH.
+    assert checker.check() == ""
+    assert not checker.clients
+    assert not checker.io_files
+    assert not cache
+
+
+def test_ssh_clients_not_root(monkeypatch, caplog):
+    proc = psutil.Process(os.getpid())
+    proc.info = {"pid": proc.pid, "name": "sshd-session"}
+    monkeypatch.setattr(ssh_clients.psutil, "process_iter", lambda attrs: [proc])
+    monkeypatch.setattr(psutil.Process, "username", lambda self: "john")
+
+    checker = ssh_clients.Checker(1, file_cache=FileCache())
+
+    def read(path):
+        raise PermissionError(13, "Permission denied", path)
+
+    monkeypatch.setattr(checker.file_cache, "read", read)
+
+    with caplog.at_level(logging.INFO):
+        assert checker.check() == f"1 active clients [({proc.pid}, 'john')]"
+    assert "Must run as root" in caplog.text
+    assert f"connection {proc.pid} assumed active, user john" in caplog.text
+    assert checker.clients == {proc.pid: (0, True, "john")}
+    assert not checker.io_files